@@ -20,6 +20,8 @@ from bookmark_manager.config import (
     STYLE_DIM,
 )
 from bookmark_manager.database import Database
+from bookmark_manager.html_parser import export_bookmarks_to_html, import_bookmarks_from_html
+from bookmark_manager.models import Bookmark
 from bookmark_manager.repository import BookmarkRepository
 from bookmark_manager.service import BookmarkService
 from bookmark_manager.exceptions import (
@@ -40,10 +42,21 @@ err_console = Console(stderr=True)
 def get_service(db_path: Path) -> BookmarkService:
     """Create and return a BookmarkService instance."""
     db = Database(db_path)
+    db.initialize()
     repo = BookmarkRepository(db)
     return BookmarkService(repo)
 
 
+def _all_bookmarks(service: BookmarkService) -> list[Bookmark]:
+    """Return every stored bookmark, paging through ``list_bookmarks``."""
+    bookmarks: list[Bookmark] = []
+    while True:
+        page = service.list_bookmarks(limit=DEFAULT_LIST_LIMIT, offset=len(bookmarks))
+        bookmarks.extend(page)
+        if len(page) < DEFAULT_LIST_LIMIT:
+            return bookmarks
+
+
 @click.group()
 @click.option(
     "--db",
@@ -80,7 +93,7 @@ def add_bookmark(ctx: click.Context, url: str, title: str, tags: str, descriptio
             url=url,
             title=title,
             tags=tag_list,
-            description=description,
+            description=description or "",
         )
         console.print(f"[{STYLE_SUCCESS}]✓ Bookmark added[/{STYLE_SUCCESS}] (id={bookmark.id})")
         console.print(f"  URL:   [{STYLE_INFO}]{bookmark.url}[/{STYLE_INFO}]")
@@ -118,10 +131,7 @@ def list_bookmarks(ctx: click.Context, tag: str, limit: int, offset: int) -> Non
     """List bookmarks, optionally filtered by tag."""
     try:
         service = get_service(ctx.obj["db_path"])
-        if tag:
-            bookmarks = service.get_bookmarks_by_tag(tag, limit=limit, offset=offset)
-        else:
-            bookmarks = service.list_bookmarks(limit=limit, offset=offset)
+        bookmarks = service.list_bookmarks(tag=tag, limit=limit, offset=offset)
 
         if not bookmarks:
             console.print(f"[{STYLE_DIM}]No bookmarks found.[/{STYLE_DIM}]")
@@ -161,12 +171,20 @@ def list_bookmarks(ctx: click.Context, tag: str, limit: int, offset: int) -> Non
     show_default=True,
     help="Maximum number of results.",
 )
+@click.option(
+    "--fts",
+    is_flag=True,
+    help="Use the full-text index: word-prefix matches, ranked by relevance.",
+)
 @click.pass_context
-def search_bookmarks(ctx: click.Context, query: str, limit: int) -> None:
+def search_bookmarks(ctx: click.Context, query: str, limit: int, fts: bool) -> None:
     """Search bookmarks by URL, title, or description."""
     try:
         service = get_service(ctx.obj["db_path"])
-        bookmarks = service.search_bookmarks(query, limit=limit)
+        if fts:
+            bookmarks = service.search_bookmarks_fts(query, limit=limit)
+        else:
+            bookmarks = service.search_bookmarks(query, limit=limit)
 
         if not bookmarks:
             console.print(f"[{STYLE_DIM}]No results for '{query}'.[/{STYLE_DIM}]")
@@ -230,7 +248,7 @@ def list_tags(ctx: click.Context, limit: int) -> None:
     """List all tags with bookmark counts."""
     try:
         service = get_service(ctx.obj["db_path"])
-        tag_counts = service.list_tags(limit=limit)
+        tag_counts = service.list_tags()[:limit]
 
         if not tag_counts:
             console.print(f"[{STYLE_DIM}]No tags found.[/{STYLE_DIM}]")
@@ -241,7 +259,7 @@ def list_tags(ctx: click.Context, limit: int) -> None:
         table.add_column("Count", justify="right")
 
         for tc in tag_counts:
-            table.add_row(tc.tag, str(tc.count))
+            table.add_row(tc.name, str(tc.count))
 
         console.print(table)
     except DatabaseError as e:
@@ -259,9 +277,11 @@ def export_bookmarks(ctx: click.Context, filepath: str) -> None:
     """Export all bookmarks to a Netscape HTML file."""
     try:
         service = get_service(ctx.obj["db_path"])
-        count = service.export_bookmarks(Path(filepath))
+        bookmarks = _all_bookmarks(service)
+        export_bookmarks_to_html(bookmarks, Path(filepath))
         console.print(
-            f"[{STYLE_SUCCESS}]✓ Exported {count} bookmark(s)[/{STYLE_SUCCESS}] to {filepath}"
+            f"[{STYLE_SUCCESS}]✓ Exported {len(bookmarks)} bookmark(s)[/{STYLE_SUCCESS}] "
+            f"to {filepath}"
         )
     except BookmarkExportError as e:
         err_console.print(f"[{STYLE_ERROR}]✗ Export failed:[/{STYLE_ERROR}] {e}")
@@ -288,12 +308,12 @@ def import_bookmarks(ctx: click.Context, filepath: str, skip_duplicates: bool) -
     """Import bookmarks from a Netscape HTML file."""
     try:
         service = get_service(ctx.obj["db_path"])
-        result = service.import_bookmarks(Path(filepath), skip_duplicates=skip_duplicates)
+        result = import_bookmarks_from_html(Path(filepath), service)
         console.print(
             f"[{STYLE_SUCCESS}]✓ Import complete:[/{STYLE_SUCCESS}] "
             f"{result.imported} imported, "
             f"[{STYLE_WARNING}]{result.skipped} skipped[/{STYLE_WARNING}], "
-            f"[{STYLE_ERROR}]{result.failed} failed[/{STYLE_ERROR}]."
+            f"[{STYLE_ERROR}]{len(result.errors)} failed[/{STYLE_ERROR}]."
         )
         if result.errors:
             for err in result.errors[:5]:
@@ -11,9 +11,13 @@ APP_VERSION = "1.0.0"
 DEFAULT_DB_DIR = Path.home() / ".bookmark_manager"
 DEFAULT_DB_NAME = "bookmarks.db"
 DB_PATH = DEFAULT_DB_DIR / DEFAULT_DB_NAME
+DEFAULT_DB_PATH = DB_PATH
+DB_PATH_ENV_VAR = "BOOKMARK_DB_PATH"
+SCHEMA_FILE = Path(__file__).parent / "schema.sql"
 
 # URL validation
 VALID_SCHEMES = {"http", "https", "ftp", "ftps"}
+ACCEPTED_SCHEMES = frozenset({"http", "https"})
 DEFAULT_SCHEME = "https"
 MAX_URL_LENGTH = 2048
 MAX_TITLE_LENGTH = 500
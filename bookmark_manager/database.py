@@ -19,6 +19,37 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Secondary indexes applied on top of the schema file.  bookmark_tags' primary
+# key is (bookmark_id, tag_id), which cannot serve tag -> bookmark lookups;
+# this reverse composite index covers them without touching the table.
+INDEX_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_bookmark_tags_tag ON bookmark_tags(tag_id, bookmark_id);
+"""
+
+# External-content FTS5 index over bookmarks, kept in sync by triggers.  It
+# stores only the token index; the text itself stays in ``bookmarks``.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS bookmarks_fts USING fts5(
+    url, title, description,
+    content='bookmarks', content_rowid='id',
+    tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS bookmarks_fts_ai AFTER INSERT ON bookmarks BEGIN
+    INSERT INTO bookmarks_fts(rowid, url, title, description)
+    VALUES (new.id, new.url, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS bookmarks_fts_ad AFTER DELETE ON bookmarks BEGIN
+    INSERT INTO bookmarks_fts(bookmarks_fts, rowid, url, title, description)
+    VALUES ('delete', old.id, old.url, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS bookmarks_fts_au AFTER UPDATE ON bookmarks BEGIN
+    INSERT INTO bookmarks_fts(bookmarks_fts, rowid, url, title, description)
+    VALUES ('delete', old.id, old.url, old.title, old.description);
+    INSERT INTO bookmarks_fts(rowid, url, title, description)
+    VALUES (new.id, new.url, new.title, new.description);
+END;
+"""
+
 
 class Database:
     """Manages SQLite connections and schema lifecycle.
@@ -32,27 +63,40 @@ class Database:
             conn.execute("SELECT 1")
     """
 
-    def __init__(self, db_path: Optional[Path] = None) -> None:
+    def __init__(
+        self, db_path: Optional[Path] = None, *, uri: Optional[str] = None
+    ) -> None:
         """Initialise the Database manager.
 
         Args:
             db_path: Path to the SQLite file.  Defaults to the value of the
                 ``BOOKMARK_MANAGER_DB`` environment variable, or
                 ``~/.local/share/bookmark_manager/bookmarks.db``.
+            uri: An SQLite ``file:`` URI (e.g. a shared-cache in-memory
+                database), passed to sqlite3 verbatim.  Mutually exclusive
+                with *db_path*.
+
+        Raises:
+            ValueError: If both *db_path* and *uri* are given.
         """
-        if db_path is not None:
-            self._db_path = Path(db_path)
-        else:
-            env_path = os.environ.get(DB_PATH_ENV_VAR)
-            self._db_path = Path(env_path) if env_path else DEFAULT_DB_PATH
+        if db_path is not None and uri is not None:
+            raise ValueError("Pass either db_path or uri, not both")
+        self._uri = uri
+        self._db_path: Optional[Path] = None
+        if uri is None:
+            if db_path is not None:
+                self._db_path = Path(db_path)
+            else:
+                env_path = os.environ.get(DB_PATH_ENV_VAR)
+                self._db_path = Path(env_path) if env_path else DEFAULT_DB_PATH
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     @property
-    def path(self) -> Path:
-        """Resolved path to the SQLite database file."""
+    def path(self) -> Optional[Path]:
+        """Resolved path to the SQLite database file, or None for a URI database."""
         return self._db_path
 
     def initialize(self) -> None:
@@ -62,16 +106,25 @@ class Database:
             DatabaseError: If the schema file cannot be read or the schema
                            cannot be applied.
         """
-        try:
-            self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            raise DatabaseError("initialize", f"Cannot create data directory: {exc}") from exc
+        if self._db_path is not None:
+            try:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                raise DatabaseError(
+                    "initialize", f"Cannot create data directory: {exc}"
+                ) from exc
 
         schema_sql = self._load_schema()
         try:
             with self.connection() as conn:
+                fts_exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'bookmarks_fts'"
+                ).fetchone()
                 conn.executescript(schema_sql)
-            logger.debug("Database initialized at %s", self._db_path)
+                conn.executescript(INDEX_SCHEMA)
+                if not fts_exists:
+                    self._create_fts(conn)
+            logger.debug("Database initialized at %s", self._uri or self._db_path)
         except sqlite3.Error as exc:
             raise DatabaseError("initialize", str(exc)) from exc
 
@@ -89,10 +142,14 @@ class Database:
         """
         conn: Optional[sqlite3.Connection] = None
         try:
-            conn = sqlite3.connect(str(self._db_path))
+            if self._uri is not None:
+                conn = sqlite3.connect(self._uri, uri=True)
+            else:
+                conn = sqlite3.connect(str(self._db_path))
             conn.row_factory = sqlite3.Row
             # Enforce WAL and FK at connection level (schema PRAGMA runs once
-            # at init, but we re-apply per connection for safety).
+            # at init, but we re-apply per connection for safety).  In-memory
+            # databases ignore the WAL request and stay in memory journal mode.
             conn.execute("PRAGMA journal_mode = WAL")
             conn.execute("PRAGMA foreign_keys = ON")
             yield conn
@@ -113,6 +170,20 @@ class Database:
     # Private helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _create_fts(conn: sqlite3.Connection) -> None:
+        """Create the FTS5 index and its triggers, then index existing rows.
+
+        SQLite builds without FTS5 are tolerated: the index is skipped, and
+        only ``BookmarkRepository.search_fts`` is unavailable.
+        """
+        try:
+            conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError as exc:
+            logger.warning("Full-text index unavailable: %s", exc)
+            return
+        conn.execute("INSERT INTO bookmarks_fts(bookmarks_fts) VALUES ('rebuild')")
+
     def _load_schema(self) -> str:
         """Read the SQL schema file.
 
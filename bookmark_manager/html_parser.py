@@ -19,8 +19,7 @@ except ImportError as exc:  # pragma: no cover
         "Install it with: pip install beautifulsoup4"
     ) from exc
 
-from bookmark_manager.exceptions import ExportError
-from bookmark_manager.exceptions import ImportError as BMImportError
+from bookmark_manager.exceptions import BookmarkExportError, BookmarkImportError
 from bookmark_manager.models import Bookmark, ImportResult
 from bookmark_manager.service import BookmarkService
 
@@ -76,32 +75,54 @@ class BookmarkHTMLParser:
             List of ``_ParsedEntry`` objects.
 
         Raises:
-            BMImportError: If the file cannot be read or parsed.
+            BookmarkImportError: If the file cannot be read or parsed.
         """
         path = Path(filepath)
         if not path.exists():
-            raise BMImportError(str(filepath), "File not found")
+            raise BookmarkImportError(str(filepath), "File not found")
         if not path.is_file():
-            raise BMImportError(str(filepath), "Path is not a file")
+            raise BookmarkImportError(str(filepath), "Path is not a file")
 
         try:
             html = path.read_text(encoding="utf-8", errors="replace")
         except OSError as exc:
-            raise BMImportError(str(filepath), f"Cannot read file: {exc}") from exc
+            raise BookmarkImportError(str(filepath), f"Cannot read file: {exc}") from exc
 
+        return self._parse(html, source=str(filepath))
+
+    def parse(self, html: str | bytes) -> List[_ParsedEntry]:
+        """Parse bookmark HTML that is already held in memory.
+
+        Args:
+            html: Netscape bookmark HTML document.  ``bytes`` are handed to
+                BeautifulSoup undecoded; it sniffs the encoding itself.
+
+        Returns:
+            List of ``_ParsedEntry`` objects.
+
+        Raises:
+            BookmarkImportError: If the HTML cannot be parsed.
+        """
+        return self._parse(html, source="<string>")
+
+    # ------------------------------------------------------------------
+    # Private extraction logic
+    # ------------------------------------------------------------------
+
+    def _parse(self, html: str | bytes, source: str) -> List[_ParsedEntry]:
+        """Build the soup for *html* and extract its entries.
+
+        ``source`` is only used for error messages and logging.
+        """
         try:
             soup = BeautifulSoup(html, "html.parser")
         except Exception as exc:  # noqa: BLE001
-            raise BMImportError(str(filepath), f"HTML parse error: {exc}") from exc
+            raise BookmarkImportError(source, f"HTML parse error: {exc}") from exc
 
         entries = list(self._extract_entries(soup))
-        logger.debug("Parsed %d bookmark entries from %s", len(entries), filepath)
+        logger.debug("Parsed %d bookmark entries from %s", len(entries), source)
         return entries
 
-    # ------------------------------------------------------------------
-    # Private extraction logic
-    # ------------------------------------------------------------------
-
     def _extract_entries(self, soup: BeautifulSoup) -> Generator[_ParsedEntry, None, None]:
         """Walk all <A> tags that look like bookmarks."""
         for a_tag in soup.find_all("a"):
@@ -129,15 +150,29 @@ class BookmarkHTMLParser:
 
     @staticmethod
     def _extract_description(a_tag: BSTag) -> str:
-        """Extract the description from a <DD> sibling of the parent <DT>."""
-        parent = a_tag.parent  # typically <DT>
-        if parent is None:
+        """Extract the description from the <DD> that follows a bookmark's <A>."""
+        # html.parser leaves <DT> unclosed, so the <DD> usually ends up nested
+        # inside it as a sibling of the <A>; check there first.
+        sibling = a_tag.find_next_sibling()
+        if sibling is None or (sibling.name or "").lower() != "dd":
+            parent = a_tag.parent  # typically <DT>
+            if parent is None:
+                return ""
+            # Look for the next sibling that is a <DD> element
+            sibling = parent.find_next_sibling()
+        if sibling is None or (sibling.name or "").lower() != "dd":
             return ""
-        # Look for the next sibling that is a <DD> element
-        sibling = parent.find_next_sibling()
-        if sibling and sibling.name and sibling.name.lower() == "dd":
-            return sibling.get_text(strip=True)
-        return ""
+        # An unclosed <DD> also swallows the entries after it, so stop at the
+        # next <DT> or <DL>; inline markup such as <b> is kept as text.
+        parts: List[str] = []
+        for child in sibling.children:
+            if isinstance(child, BSTag):
+                if (child.name or "").lower() in ("dt", "dl"):
+                    break
+                parts.append(child.get_text())
+            else:
+                parts.append(str(child))
+        return "".join(parts).strip()
 
 
 # ---------------------------------------------------------------------------
@@ -161,10 +196,10 @@ def import_bookmarks_from_html(
         ImportResult summarising what happened.
 
     Raises:
-        BMImportError: If the file cannot be read or parsed at all.
+        BookmarkImportError: If the file cannot be read or parsed at all.
     """
     parser = BookmarkHTMLParser()
-    entries = parser.parse_file(filepath)  # may raise BMImportError
+    entries = parser.parse_file(filepath)  # may raise BookmarkImportError
 
     result = ImportResult()
     extra_tags = default_tags or []
@@ -209,25 +244,15 @@ HTML_TEMPLATE = """<!DOCTYPE NETSCAPE-Bookmark-file-1>
 ENTRY_TEMPLATE = '    <DT><A HREF="{url}" ADD_DATE="{add_date}" TAGS="{tags}">{title}</A>\n{description}'
 
 
-def export_bookmarks_to_html(
-    bookmarks: List[Bookmark],
-    filepath: str | Path,
-) -> None:
-    """Export a list of bookmarks to a Netscape-format HTML file.
+def render_bookmarks_html(bookmarks: List[Bookmark]) -> str:
+    """Render bookmarks as a Netscape-format HTML document.
 
     Args:
-        bookmarks: List of Bookmark objects to export.
-        filepath: Destination file path.  Parent directories are created.
+        bookmarks: Bookmark objects to include, in output order.
 
-    Raises:
-        ExportError: If the file cannot be written.
+    Returns:
+        The complete HTML document as a string.
     """
-    path = Path(filepath)
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-    except OSError as exc:
-        raise ExportError(str(filepath), f"Cannot create directory: {exc}") from exc
-
     entry_lines: List[str] = []
     for bm in bookmarks:
         add_date = int(bm.created_at.timestamp())
@@ -245,12 +270,34 @@ def export_bookmarks_to_html(
         )
         entry_lines.append(entry)
 
-    html_content = HTML_TEMPLATE.format(entries="\n".join(entry_lines))
+    return HTML_TEMPLATE.format(entries="\n".join(entry_lines))
+
+
+def export_bookmarks_to_html(
+    bookmarks: List[Bookmark],
+    filepath: str | Path,
+) -> None:
+    """Export a list of bookmarks to a Netscape-format HTML file.
+
+    Args:
+        bookmarks: List of Bookmark objects to export.
+        filepath: Destination file path.  Parent directories are created.
+
+    Raises:
+        BookmarkExportError: If the file cannot be written.
+    """
+    path = Path(filepath)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        raise BookmarkExportError(str(filepath), f"Cannot create directory: {exc}") from exc
+
+    html_content = render_bookmarks_html(bookmarks)
 
     try:
         path.write_text(html_content, encoding="utf-8")
     except OSError as exc:
-        raise ExportError(str(filepath), f"Cannot write file: {exc}") from exc
+        raise BookmarkExportError(str(filepath), f"Cannot write file: {exc}") from exc
 
     logger.info("Exported %d bookmarks to %s", len(bookmarks), filepath)
 
@@ -1,30 +1,41 @@
 """Data models for the CLI Bookmark Manager.
 
-All models are frozen dataclasses to ensure immutability after creation.
+All models except the ImportResult accumulator are frozen, slotted
+dataclasses: immutable after creation and without a per-instance ``__dict__``.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
 
 
-@dataclass(frozen=True)
+def _utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime, like stored timestamps."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True, slots=True)
 class Tag:
     """Represents a bookmark tag."""
 
     id: int
     name: str
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
 
     def __str__(self) -> str:
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bookmark:
-    """Represents a stored bookmark."""
+    """Represents a stored bookmark.
+
+    ``tags`` is a tuple, normalised on construction to sorted order with
+    duplicates removed, so two bookmarks with the same tags compare equal
+    regardless of input order, and the bookmark stays hashable.
+    """
 
     id: int
     url: str
@@ -32,14 +43,22 @@ class Bookmark:
     description: str
     created_at: datetime
     updated_at: datetime
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tags", _sorted_tags(self.tags))
 
     def __str__(self) -> str:
         tag_str = ", ".join(self.tags) if self.tags else "(no tags)"
         return f"[{self.id}] {self.title}\n    {self.url}\n    Tags: {tag_str}"
 
 
-@dataclass(frozen=True)
+def _sorted_tags(tags: Iterable[str]) -> Tuple[str, ...]:
+    """Return *tags* as a sorted tuple with duplicates removed."""
+    return tuple(sorted(set(tags)))
+
+
+@dataclass(frozen=True, slots=True)
 class TagCount:
     """Represents a tag with its usage count."""
 
@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 import sqlite3
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from bookmark_manager.database import Database
 from bookmark_manager.exceptions import (
@@ -30,6 +30,16 @@ def _parse_dt(value: str) -> datetime:
     return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
 
 
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 MATCH expression of quoted prefix terms.
+
+    Quoting each whitespace-separated term keeps punctuation such as the
+    dot in ``python.org`` from being read as FTS5 query syntax; the trailing
+    ``*`` lets ``"pyth"`` match ``python``.  All terms must match.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in query.split())
+
+
 class BookmarkRepository:
     """Data-access object for bookmarks and tags.
 
@@ -59,15 +69,65 @@ class BookmarkRepository:
         sql = """
             INSERT INTO bookmarks (url, title, description)
             VALUES (?, ?, ?)
+            RETURNING *
         """
         try:
             with self._db.connection() as conn:
-                cur = conn.execute(sql, (url, title, description))
-                bookmark_id = cur.lastrowid
-            logger.debug("Created bookmark id=%s url=%s", bookmark_id, url)
-            return self.get_bookmark_by_id(bookmark_id)  # type: ignore[arg-type]
+                row = conn.execute(sql, (url, title, description)).fetchone()
         except sqlite3.IntegrityError:
             raise DuplicateBookmarkError(url)
+        logger.debug("Created bookmark id=%s url=%s", row["id"], url)
+        # A freshly inserted bookmark has no tag associations yet.
+        return self._row_to_bookmark(row, [])
+
+    def bulk_create(self, bookmarks: Iterable[Bookmark]) -> List[Bookmark]:
+        """Insert many bookmarks and their tags in a single transaction.
+
+        Only ``url``, ``title``, ``description`` and ``tags`` are read from
+        each input; ids and timestamps are assigned by the database.
+
+        Returns:
+            The created Bookmarks, in input order.
+
+        Raises:
+            DuplicateBookmarkError: If any URL already exists (or repeats
+                within the batch).  Nothing from the batch is persisted.
+            DatabaseError: On unexpected DB errors.
+        """
+        sql_insert = """
+            INSERT INTO bookmarks (url, title, description)
+            VALUES (?, ?, ?)
+            RETURNING *
+        """
+        sql_tag = """
+            INSERT INTO tags (name)
+            SELECT ? WHERE NOT EXISTS (SELECT 1 FROM tags WHERE name = ?)
+        """
+        sql_link = """
+            INSERT OR IGNORE INTO bookmark_tags (bookmark_id, tag_id)
+            SELECT ?, id FROM tags WHERE name = ?
+        """
+        created: List[Bookmark] = []
+        links: List[Tuple[int, str]] = []
+        url = ""
+        try:
+            with self._db.connection() as conn:
+                for bm in bookmarks:
+                    url = bm.url
+                    row = conn.execute(
+                        sql_insert, (bm.url, bm.title or "", bm.description or "")
+                    ).fetchone()
+                    links.extend((row["id"], name) for name in bm.tags)
+                    created.append(self._row_to_bookmark(row, bm.tags))
+                tag_names = sorted({name for _, name in links})
+                conn.executemany(sql_tag, [(name, name) for name in tag_names])
+                conn.executemany(sql_link, links)
+        except sqlite3.IntegrityError as exc:
+            if "UNIQUE constraint failed: bookmarks.url" not in str(exc):
+                raise DatabaseError("bulk_create", str(exc)) from exc
+            raise DuplicateBookmarkError(url) from exc
+        logger.debug("Bulk-created %d bookmarks", len(created))
+        return created
 
     def get_bookmark_by_id(self, bookmark_id: int) -> Bookmark:
         """Fetch a single bookmark by primary key.
@@ -121,12 +181,7 @@ class BookmarkRepository:
 
         with self._db.connection() as conn:
             rows = conn.execute(sql, params).fetchall()
-
-        bookmarks = []
-        for row in rows:
-            tags = self._get_tag_names_for_bookmark(row["id"])
-            bookmarks.append(self._row_to_bookmark(row, tags))
-        return bookmarks
+            return self._rows_to_bookmarks(conn, rows)
 
     def update_bookmark(
         self,
@@ -139,34 +194,35 @@ class BookmarkRepository:
         Raises:
             BookmarkNotFoundError: If the bookmark does not exist.
         """
-        # Verify existence first
-        existing = self.get_bookmark_by_id(bookmark_id)
-
-        new_title = title if title is not None else existing.title
-        new_desc = description if description is not None else existing.description
-
         sql = """
             UPDATE bookmarks
-               SET title = ?, description = ?
+               SET title = COALESCE(?, title),
+                   description = COALESCE(?, description)
              WHERE id = ?
+            RETURNING *
         """
         with self._db.connection() as conn:
-            conn.execute(sql, (new_title, new_desc, bookmark_id))
-
-        return self.get_bookmark_by_id(bookmark_id)
+            row = conn.execute(sql, (title, description, bookmark_id)).fetchone()
+            if row is None:
+                raise BookmarkNotFoundError(bookmark_id)
+            return self._row_to_bookmark(row, self._tag_names(conn, bookmark_id))
 
-    def delete_bookmark(self, bookmark_id: int) -> None:
+    def delete_bookmark(self, bookmark_id: int) -> int:
         """Delete a bookmark and its tag associations (cascade handles tags).
 
+        Returns:
+            The id of the deleted bookmark.
+
         Raises:
             BookmarkNotFoundError: If no bookmark with that id exists.
         """
-        # Verify existence
-        self.get_bookmark_by_id(bookmark_id)
-        sql = "DELETE FROM bookmarks WHERE id = ?"
+        sql = "DELETE FROM bookmarks WHERE id = ? RETURNING id"
         with self._db.connection() as conn:
-            conn.execute(sql, (bookmark_id,))
+            row = conn.execute(sql, (bookmark_id,)).fetchone()
+        if row is None:
+            raise BookmarkNotFoundError(bookmark_id)
         logger.debug("Deleted bookmark id=%s", bookmark_id)
+        return int(row["id"])
 
     def search_bookmarks(self, query: str, limit: int = 50) -> List[Bookmark]:
         """Full-text search across URL, title, and description."""
@@ -181,12 +237,31 @@ class BookmarkRepository:
         """
         with self._db.connection() as conn:
             rows = conn.execute(sql, (pattern, pattern, pattern, limit)).fetchall()
+            return self._rows_to_bookmarks(conn, rows)
+
+    def search_fts(self, query: str, limit: int = 50) -> List[Bookmark]:
+        """Ranked full-text search across URL, title, and description.
 
-        bookmarks = []
-        for row in rows:
-            tags = self._get_tag_names_for_bookmark(row["id"])
-            bookmarks.append(self._row_to_bookmark(row, tags))
-        return bookmarks
+        Backed by the ``bookmarks_fts`` FTS5 index, so each term matches the
+        start of a (stemmed) token rather than any substring: ``"guides"``
+        and ``"pyth"`` both find ``"Python Guide"``, but ``"thon"`` does
+        not.  Results are ordered by relevance.  Unlike
+        ``search_bookmarks``, this needs an SQLite build with FTS5.
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+        sql = """
+            SELECT b.*
+              FROM bookmarks_fts f
+              JOIN bookmarks b ON b.id = f.rowid
+             WHERE bookmarks_fts MATCH ?
+             ORDER BY f.rank
+             LIMIT ?
+        """
+        with self._db.connection() as conn:
+            rows = conn.execute(sql, (match, limit)).fetchall()
+            return self._rows_to_bookmarks(conn, rows)
 
     # ------------------------------------------------------------------
     # Tag management
@@ -267,6 +342,23 @@ class BookmarkRepository:
 
     def _get_tag_names_for_bookmark(self, bookmark_id: int) -> List[str]:
         """Return sorted list of tag names for a bookmark."""
+        with self._db.connection() as conn:
+            return self._tag_names(conn, bookmark_id)
+
+    def _rows_to_bookmarks(
+        self, conn: sqlite3.Connection, rows: List[sqlite3.Row]
+    ) -> List[Bookmark]:
+        """Convert bookmark rows, loading tags on the caller's connection.
+
+        Reusing one connection means the tag query is prepared once (via
+        sqlite3's statement cache) instead of once per row on a fresh
+        connection.
+        """
+        return [self._row_to_bookmark(row, self._tag_names(conn, row["id"])) for row in rows]
+
+    @staticmethod
+    def _tag_names(conn: sqlite3.Connection, bookmark_id: int) -> List[str]:
+        """Return sorted tag names for a bookmark using an open connection."""
         sql = """
             SELECT t.name
               FROM tags t
@@ -274,12 +366,11 @@ class BookmarkRepository:
              WHERE bt.bookmark_id = ?
              ORDER BY t.name ASC
         """
-        with self._db.connection() as conn:
-            rows = conn.execute(sql, (bookmark_id,)).fetchall()
+        rows = conn.execute(sql, (bookmark_id,)).fetchall()
         return [row["name"] for row in rows]
 
     @staticmethod
-    def _row_to_bookmark(row: sqlite3.Row, tags: List[str]) -> Bookmark:
+    def _row_to_bookmark(row: sqlite3.Row, tags: Iterable[str]) -> Bookmark:
         """Convert a sqlite3.Row to a Bookmark dataclass."""
         return Bookmark(
             id=row["id"],
@@ -288,5 +379,5 @@ class BookmarkRepository:
             description=row["description"],
             created_at=_parse_dt(row["created_at"]),
             updated_at=_parse_dt(row["updated_at"]),
-            tags=tags,
+            tags=tuple(tags),
         )
@@ -30,6 +30,9 @@ from bookmark_manager.repository import BookmarkRepository
 
 logger = logging.getLogger(__name__)
 
+# Matches a leading "scheme://" so bare hosts can get DEFAULT_SCHEME prepended.
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+\-.]*://", re.ASCII)
+
 
 class BookmarkService:
     """High-level bookmark operations with validation and normalization.
@@ -127,6 +130,25 @@ class BookmarkService:
             return []
         return self._repo.search_bookmarks(query.strip(), limit=limit)
 
+    def search_bookmarks_fts(
+        self, query: str, limit: int = DEFAULT_LIST_LIMIT
+    ) -> List[Bookmark]:
+        """Search bookmarks through the full-text index, best match first.
+
+        Each term matches the start of a word, so ``"pyth"`` finds
+        ``"Python"`` but ``"thon"`` does not.  Requires SQLite with FTS5.
+
+        Args:
+            query: Search string.
+            limit: Maximum results.
+
+        Returns:
+            Matching Bookmark objects, ranked by relevance.
+        """
+        if not query or not query.strip():
+            return []
+        return self._repo.search_fts(query.strip(), limit=limit)
+
     def delete_bookmark(self, bookmark_id: int) -> None:
         """Delete a bookmark by ID.
 
@@ -245,7 +267,7 @@ class BookmarkService:
             raise InvalidURLError(raw_url, "URL is empty")
 
         # Add scheme if missing
-        if not re.match(r'^[a-zA-Z][a-zA-Z0-9+\-.]*://', url):
+        if not _SCHEME_RE.match(url):
             url = f"{DEFAULT_SCHEME}://{url}"
 
         try:
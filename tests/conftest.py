@@ -1,19 +1,46 @@
 """Shared pytest fixtures for the CLI Bookmark Manager test suite."""
 from __future__ import annotations
 
+import itertools
 import os
+import sqlite3
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable, Iterator
 
 import pytest
 from click.testing import CliRunner
 
 from bookmark_manager.database import Database
+from bookmark_manager.html_parser import BookmarkHTMLParser
 from bookmark_manager.models import Bookmark
 from bookmark_manager.repository import BookmarkRepository
 from bookmark_manager.service import BookmarkService
 
+# Named shared-cache in-memory databases: every connection opened with the
+# same URI sees the same data, and the database lives until the last
+# connection to it is closed.
+_MEMORY_DB_URI = "file:bookmarks_test_{}?mode=memory&cache=shared"
+_memory_db_ids = itertools.count()
+
+
+def _open_memory_db() -> tuple[str, sqlite3.Connection]:
+    """Create a fresh in-memory database and return its URI plus a keep-alive connection."""
+    uri = _MEMORY_DB_URI.format(next(_memory_db_ids))
+    return uri, sqlite3.connect(uri, uri=True)
+
+
+def _clone_template(template: sqlite3.Connection) -> tuple[str, sqlite3.Connection]:
+    """Copy *template* into a fresh in-memory database via ``Connection.backup``.
+
+    Copying the already-built pages means no schema DDL or seed inserts run
+    per clone.
+    """
+    uri, keeper = _open_memory_db()
+    template.backup(keeper)
+    return uri, keeper
+
 
 @pytest.fixture
 def tmp_db_path(tmp_path: Path) -> Path:
@@ -21,12 +48,38 @@ def tmp_db_path(tmp_path: Path) -> Path:
     return tmp_path / "test_bookmarks.db"
 
 
+@pytest.fixture(scope="session")
+def schema_template() -> Iterator[sqlite3.Connection]:
+    """Apply the schema once per session to an in-memory template database."""
+    uri, keeper = _open_memory_db()
+    Database(uri=uri).initialize()
+    yield keeper
+    keeper.close()
+
+
+@pytest.fixture(scope="session")
+def _engine(
+    schema_template: sqlite3.Connection,
+) -> Iterator[tuple[Database, sqlite3.Connection]]:
+    """Return the session-wide in-memory Database and its keep-alive connection."""
+    uri, keeper = _clone_template(schema_template)
+    yield Database(uri=uri), keeper
+    keeper.close()
+
+
 @pytest.fixture
-def db(tmp_db_path: Path) -> Database:
-    """Create and return an initialised Database instance backed by a temp file."""
-    database = Database(str(tmp_db_path))
-    database.initialize()
-    return database
+def db(
+    _engine: tuple[Database, sqlite3.Connection],
+    schema_template: sqlite3.Connection,
+) -> Iterator[Database]:
+    """Return the session Database, rolled back to an empty schema after the test.
+
+    ``Database`` commits on every operation, so a wrapping SAVEPOINT cannot
+    span a test; restoring the template pages on teardown has the same effect.
+    """
+    database, keeper = _engine
+    yield database
+    schema_template.backup(keeper)
 
 
 @pytest.fixture
@@ -35,36 +88,107 @@ def repository(db: Database) -> BookmarkRepository:
     return BookmarkRepository(db)
 
 
+@pytest.fixture
+def bulk_create(
+    repository: BookmarkRepository,
+) -> Callable[[list[dict[str, Any]]], list[Bookmark]]:
+    """Return a helper that seeds ``repository`` from plain dicts in one transaction.
+
+    Each dict needs a ``url``; ``title``, ``description`` and ``tags`` are
+    optional.
+    """
+
+    def _bulk(rows: list[dict[str, Any]]) -> list[Bookmark]:
+        return repository.bulk_create(
+            Bookmark(
+                id=None,
+                url=row["url"],
+                title=row.get("title", ""),
+                description=row.get("description", ""),
+                tags=tuple(row.get("tags", ())),
+                created_at=None,
+                updated_at=None,
+            )
+            for row in rows
+        )
+
+    return _bulk
+
+
+@pytest.fixture(scope="class")
+def class_repository(schema_template: sqlite3.Connection) -> Iterator[BookmarkRepository]:
+    """Return an empty repository shared by every test in a class."""
+    uri, keeper = _clone_template(schema_template)
+    yield BookmarkRepository(Database(uri=uri))
+    keeper.close()
+
+
+@pytest.fixture(scope="session")
+def corpus_template(
+    schema_template: sqlite3.Connection,
+    sample_bookmarks: tuple[Bookmark, ...],
+) -> Iterator[sqlite3.Connection]:
+    """Seed ``sample_bookmarks`` once per session into an in-memory template."""
+    uri, keeper = _clone_template(schema_template)
+    BookmarkRepository(Database(uri=uri)).bulk_create(sample_bookmarks)
+    yield keeper
+    keeper.close()
+
+
+@pytest.fixture(scope="module")
+def populated_db(corpus_template: sqlite3.Connection) -> Iterator[Database]:
+    """Return a per-module copy of the seeded corpus.
+
+    It is separate from ``db``, so write tests never see the corpus; every
+    test in the module shares it, so only read-only tests may use it.
+    """
+    uri, keeper = _clone_template(corpus_template)
+    yield Database(uri=uri)
+    keeper.close()
+
+
+@pytest.fixture(scope="module")
+def populated_repository(populated_db: Database) -> BookmarkRepository:
+    """Return a read-only repository over the ``populated_db`` corpus."""
+    return BookmarkRepository(populated_db)
+
+
 @pytest.fixture
 def service(repository: BookmarkRepository) -> BookmarkService:
     """Return a BookmarkService wired to the temp repository."""
     return BookmarkService(repository)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bookmark() -> Bookmark:
-    """Return a single sample Bookmark object (not yet persisted)."""
+    """Return a single sample Bookmark object (not yet persisted).
+
+    Bookmark is frozen, so one instance is safely shared by the session.
+    """
     return Bookmark(
         id=None,
         url="https://example.com",
         title="Example Site",
         description="A sample bookmark for testing",
-        tags=["python", "testing"],
+        tags=("python", "testing"),
         created_at=None,
         updated_at=None,
     )
 
 
-@pytest.fixture
-def sample_bookmarks() -> list[Bookmark]:
-    """Return a list of sample Bookmark objects (not yet persisted)."""
-    return [
+@pytest.fixture(scope="session")
+def sample_bookmarks() -> tuple[Bookmark, ...]:
+    """Return a tuple of sample Bookmark objects (not yet persisted).
+
+    Shared by the whole session, so tests must treat it as read-only.
+    """
+    return (
         Bookmark(
             id=None,
             url="https://python.org",
             title="Python",
             description="The Python programming language",
-            tags=["python", "programming"],
+            tags=("python", "programming"),
             created_at=None,
             updated_at=None,
         ),
@@ -73,7 +197,7 @@ def sample_bookmarks() -> list[Bookmark]:
             url="https://pytest.org",
             title="pytest",
             description="Testing framework",
-            tags=["python", "testing"],
+            tags=("python", "testing"),
             created_at=None,
             updated_at=None,
         ),
@@ -82,11 +206,11 @@ def sample_bookmarks() -> list[Bookmark]:
             url="https://github.com",
             title="GitHub",
             description="Code hosting",
-            tags=["git", "hosting"],
+            tags=("git", "hosting"),
             created_at=None,
             updated_at=None,
         ),
-    ]
+    )
 
 
 @pytest.fixture
@@ -101,21 +225,33 @@ def cli_env(tmp_db_path: Path) -> dict[str, str]:
     return {"BOOKMARK_DB_PATH": str(tmp_db_path)}
 
 
-@pytest.fixture
-def sample_html() -> str:
-    """Return a minimal Netscape bookmark HTML string for parser tests."""
-    return """<!DOCTYPE NETSCAPE-Bookmark-file-1>
-<!-- This is an automatically generated file.
-     It will be read and overwritten.
-     DO NOT EDIT! -->
+NETSCAPE_HTML = b"""\
+<!DOCTYPE NETSCAPE-Bookmark-file-1>
 <META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
 <TITLE>Bookmarks</TITLE>
 <H1>Bookmarks</H1>
 <DL><p>
     <DT><A HREF="https://python.org" ADD_DATE="1609459200" TAGS="python,programming">Python</A>
-    <DD>The Python programming language
-    <DT><A HREF="https://pytest.org" ADD_DATE="1609459200" TAGS="python,testing">pytest</A>
-    <DD>Testing framework
-    <DT><A HREF="https://github.com" ADD_DATE="1609459200">GitHub</A>
+    <DD>The Python programming language.
+    <DT><A HREF="https://rust-lang.org" ADD_DATE="1609459201" TAGS="rust,systems">Rust</A>
+    <DT><A HREF="https://example.com" ADD_DATE="1609459202">No Tags Example</A>
 </DL><p>
 """
+
+
+@pytest.fixture(scope="session")
+def netscape_html() -> bytes:
+    """Return the shared Netscape bookmark document used by parser tests."""
+    return NETSCAPE_HTML
+
+
+@pytest.fixture(scope="session")
+def netscape_parsed(netscape_html: bytes) -> list:
+    """Parse ``netscape_html`` once per session; consumers must only read it."""
+    return BookmarkHTMLParser().parse(netscape_html)
+
+
+@pytest.fixture(scope="session")
+def netscape_by_url(netscape_parsed: list) -> dict:
+    """Index the session parse result by URL for O(1) lookups."""
+    return {entry.url: entry for entry in netscape_parsed}
@@ -1,9 +1,13 @@
 """Integration tests for CLI commands using Click's CliRunner."""
+from datetime import datetime
+
 import pytest
 from click.testing import CliRunner
-from unittest.mock import patch, MagicMock
+from unittest.mock import create_autospec, patch
 from bookmark_manager.cli import cli
+from bookmark_manager.config import DEFAULT_LIST_LIMIT
 from bookmark_manager.models import Bookmark, TagCount
+from bookmark_manager.service import BookmarkService
 from bookmark_manager.exceptions import (
     DuplicateBookmarkError,
     BookmarkNotFoundError,
@@ -20,22 +24,23 @@ def runner():
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_bookmark():
     return Bookmark(
         id=1,
         url="https://example.com",
         title="Example",
         description="A test bookmark",
-        tags=["python", "test"],
-        created_at="2024-01-01T00:00:00",
-        updated_at="2024-01-01T00:00:00",
+        tags=("python", "test"),
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
     )
 
 
 @pytest.fixture
 def mock_service():
-    return MagicMock()
+    """A service stand-in that rejects calls the real BookmarkService lacks."""
+    return create_autospec(BookmarkService, instance=True)
 
 
 def invoke(runner, args, service=None):
@@ -87,9 +92,10 @@ class TestListCommand:
         assert result.exit_code == 0
 
     def test_list_with_tag_filter(self, runner, mock_service, sample_bookmark):
-        mock_service.search_by_tag.return_value = [sample_bookmark]
+        mock_service.list_bookmarks.return_value = [sample_bookmark]
         result = invoke(runner, ["list", "--tag", "python"], mock_service)
         assert result.exit_code == 0
+        assert mock_service.list_bookmarks.call_args.kwargs["tag"] == "python"
 
     def test_list_with_limit(self, runner, mock_service, sample_bookmark):
         mock_service.list_bookmarks.return_value = [sample_bookmark]
@@ -119,15 +125,27 @@ class TestDeleteCommand:
 
 class TestSearchCommand:
     def test_search_by_tag(self, runner, mock_service, sample_bookmark):
-        mock_service.search_by_tag.return_value = [sample_bookmark]
+        mock_service.search_bookmarks.return_value = [sample_bookmark]
         result = invoke(runner, ["search", "python"], mock_service)
         assert result.exit_code == 0
 
     def test_search_no_results(self, runner, mock_service):
-        mock_service.search_by_tag.return_value = []
+        mock_service.search_bookmarks.return_value = []
         result = invoke(runner, ["search", "nonexistent"], mock_service)
         assert result.exit_code == 0
 
+    def test_search_uses_like_by_default(self, runner, mock_service):
+        mock_service.search_bookmarks.return_value = []
+        invoke(runner, ["search", "pyth"], mock_service)
+        mock_service.search_bookmarks_fts.assert_not_called()
+
+    def test_search_fts_flag_uses_full_text_index(self, runner, mock_service, sample_bookmark):
+        mock_service.search_bookmarks_fts.return_value = [sample_bookmark]
+        result = invoke(runner, ["search", "--fts", "pyth"], mock_service)
+        assert result.exit_code == 0
+        mock_service.search_bookmarks_fts.assert_called_once_with("pyth", limit=DEFAULT_LIST_LIMIT)
+        mock_service.search_bookmarks.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # tags command
@@ -135,15 +153,16 @@ class TestSearchCommand:
 
 class TestTagsCommand:
     def test_tags_lists_all(self, runner, mock_service):
-        mock_service.get_all_tags.return_value = [
+        mock_service.list_tags.return_value = [
             TagCount(name="python", count=3),
             TagCount(name="rust", count=1),
         ]
         result = invoke(runner, ["tags"], mock_service)
         assert result.exit_code == 0
+        assert "python" in result.output
 
     def test_tags_empty(self, runner, mock_service):
-        mock_service.get_all_tags.return_value = []
+        mock_service.list_tags.return_value = []
         result = invoke(runner, ["tags"], mock_service)
         assert result.exit_code == 0
 
@@ -155,12 +174,11 @@ class TestTagsCommand:
 class TestExportCommand:
     def test_export_creates_file(self, runner, mock_service, sample_bookmark, tmp_path):
         mock_service.list_bookmarks.return_value = [sample_bookmark]
-        out_file = str(tmp_path / "export.html")
-        with patch("bookmark_manager.cli.BookmarkHTMLExporter") as mock_exporter_cls:
-            mock_exporter = MagicMock()
-            mock_exporter_cls.return_value = mock_exporter
-            result = invoke(runner, ["export", out_file], mock_service)
+        out_file = tmp_path / "export.html"
+        result = invoke(runner, ["export", str(out_file)], mock_service)
         assert result.exit_code == 0
+        assert "Exported 1 bookmark" in result.output
+        assert "https://example.com" in out_file.read_text(encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -176,10 +194,32 @@ class TestImportCommand:
             '    <DT><A HREF=\"https://python.org\" TAGS=\"python\">Python</A>\n'
             "</DL>"
         )
-        from bookmark_manager.models import ImportResult
-        mock_service.import_bookmarks.return_value = ImportResult(
-            total=1, imported=1, skipped=0, errors=[]
-        )
-        with patch("bookmark_manager.cli.BookmarkHTMLParser"):
-            result = invoke(runner, ["import", str(html_file)], mock_service)
+        result = invoke(runner, ["import", str(html_file)], mock_service)
         assert result.exit_code == 0
+        mock_service.import_bookmark.assert_called_once()
+        assert mock_service.import_bookmark.call_args.kwargs["url"] == "https://python.org"
+
+
+# ---------------------------------------------------------------------------
+# end to end, against a real database file
+# ---------------------------------------------------------------------------
+
+class TestEndToEnd:
+    def test_export_then_import_into_a_fresh_database(self, runner, tmp_path):
+        source_db = str(tmp_path / "source.db")
+        target_db = str(tmp_path / "target.db")
+        out_file = str(tmp_path / "export.html")
+
+        result = runner.invoke(
+            cli, ["--db", source_db, "add", "https://example.com", "--tags", "python"]
+        )
+        assert result.exit_code == 0, result.output
+        result = runner.invoke(cli, ["--db", source_db, "export", out_file])
+        assert result.exit_code == 0, result.output
+
+        result = runner.invoke(cli, ["--db", target_db, "import", out_file])
+        assert result.exit_code == 0, result.output
+        assert "1 imported" in result.output
+        result = runner.invoke(cli, ["--db", target_db, "list", "--tag", "python"])
+        assert result.exit_code == 0, result.output
+        assert "example.com" in result.output
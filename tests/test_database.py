@@ -16,47 +16,50 @@ class TestDatabase:
         db.initialize()
         assert db_path.exists()
 
-    def test_initialize_creates_bookmarks_table(self, tmp_db_path: Path):
-        db = Database(str(tmp_db_path))
-        db.initialize()
-        with db.get_connection() as conn:
+    def test_uri_database_has_no_path(self):
+        assert Database(uri="file:uri_test?mode=memory&cache=shared").path is None
+
+    def test_rejects_both_path_and_uri(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            Database(tmp_path / "test.db", uri="file:x?mode=memory")
+
+    def test_in_memory_database_keeps_memory_journal(self, db: Database):
+        with db.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+
+    def test_initialize_creates_bookmarks_table(self, db: Database):
+        with db.connection() as conn:
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='bookmarks'"
             )
             assert cursor.fetchone() is not None
 
-    def test_initialize_creates_tags_table(self, tmp_db_path: Path):
-        db = Database(str(tmp_db_path))
-        db.initialize()
-        with db.get_connection() as conn:
+    def test_initialize_creates_tags_table(self, db: Database):
+        with db.connection() as conn:
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='tags'"
             )
             assert cursor.fetchone() is not None
 
-    def test_initialize_creates_bookmark_tags_table(self, tmp_db_path: Path):
-        db = Database(str(tmp_db_path))
-        db.initialize()
-        with db.get_connection() as conn:
+    def test_initialize_creates_bookmark_tags_table(self, db: Database):
+        with db.connection() as conn:
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='bookmark_tags'"
             )
             assert cursor.fetchone() is not None
 
-    def test_get_connection_returns_connection(self, db: Database):
-        with db.get_connection() as conn:
+    def test_connection_returns_connection(self, db: Database):
+        with db.connection() as conn:
             assert conn is not None
             assert isinstance(conn, sqlite3.Connection)
 
-    def test_initialize_idempotent(self, tmp_db_path: Path):
-        """Calling initialize() twice should not raise."""
-        db = Database(str(tmp_db_path))
+    def test_initialize_idempotent(self, db: Database):
+        """Calling initialize() on an initialised database should not raise."""
         db.initialize()
-        db.initialize()  # second call should be safe
 
     def test_connection_row_factory(self, db: Database):
         """Rows should be accessible by column name."""
-        with db.get_connection() as conn:
+        with db.connection() as conn:
             conn.execute(
                 "INSERT INTO bookmarks (url, title) VALUES (?, ?)",
                 ("https://example.com", "Example"),
@@ -65,3 +68,14 @@ class TestDatabase:
             row = conn.execute("SELECT url, title FROM bookmarks").fetchone()
             assert row["url"] == "https://example.com"
             assert row["title"] == "Example"
+
+    def test_tag_lookup_uses_covering_index(self, db: Database):
+        """Filtering bookmark_tags by tag should search the index, not scan."""
+        with db.connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN "
+                "SELECT bookmark_id FROM bookmark_tags WHERE tag_id = ?",
+                (1,),
+            ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "COVERING INDEX idx_bookmark_tags_tag" in details
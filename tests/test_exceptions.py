@@ -9,8 +9,8 @@ from bookmark_manager.exceptions import (
     DuplicateBookmarkError,
     InvalidURLError,
     DatabaseError,
-    ImportError as BMImportError,
-    ExportError,
+    BookmarkImportError,
+    BookmarkExportError,
 )
 
 
@@ -28,10 +28,10 @@ class TestExceptionHierarchy:
         assert issubclass(DatabaseError, BookmarkManagerError)
 
     def test_import_error_is_bookmark_manager_error(self):
-        assert issubclass(BMImportError, BookmarkManagerError)
+        assert issubclass(BookmarkImportError, BookmarkManagerError)
 
     def test_export_error_is_bookmark_manager_error(self):
-        assert issubclass(ExportError, BookmarkManagerError)
+        assert issubclass(BookmarkExportError, BookmarkManagerError)
 
     def test_bookmark_manager_error_is_exception(self):
         assert issubclass(BookmarkManagerError, Exception)
@@ -39,7 +39,7 @@ class TestExceptionHierarchy:
 
 class TestExceptionInstantiation:
     def test_bookmark_not_found_with_id(self):
-        exc = BookmarkNotFoundError(bookmark_id=42)
+        exc = BookmarkNotFoundError(identifier=42)
         assert "42" in str(exc)
 
     def test_duplicate_bookmark_with_url(self):
@@ -55,14 +55,14 @@ class TestExceptionInstantiation:
         assert "connection failed" in str(exc)
 
     def test_export_error_with_message(self):
-        exc = ExportError("write failed")
+        exc = BookmarkExportError("out.html", "write failed")
         assert "write failed" in str(exc)
 
 
 class TestExceptionRaising:
     def test_raise_bookmark_not_found(self):
         with pytest.raises(BookmarkNotFoundError):
-            raise BookmarkNotFoundError(bookmark_id=1)
+            raise BookmarkNotFoundError(identifier=1)
 
     def test_raise_duplicate_bookmark(self):
         with pytest.raises(DuplicateBookmarkError):
@@ -74,4 +74,4 @@ class TestExceptionRaising:
 
     def test_catch_as_base_class(self):
         with pytest.raises(BookmarkManagerError):
-            raise BookmarkNotFoundError(bookmark_id=99)
+            raise BookmarkNotFoundError(identifier=99)
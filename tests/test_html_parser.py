@@ -1,31 +1,24 @@
 """Unit tests for bookmark_manager/html_parser.py."""
+from datetime import datetime
+
 import pytest
-from bookmark_manager.html_parser import BookmarkHTMLParser, BookmarkHTMLExporter
+from bookmark_manager.html_parser import (
+    BookmarkHTMLParser,
+    export_bookmarks_to_html,
+    render_bookmarks_html,
+)
 from bookmark_manager.models import Bookmark
 
 
-NETSCAPE_HTML = """\
+EMPTY_HTML = b"""\
 <!DOCTYPE NETSCAPE-Bookmark-file-1>
-<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
 <TITLE>Bookmarks</TITLE>
 <H1>Bookmarks</H1>
 <DL><p>
-    <DT><A HREF="https://python.org" ADD_DATE="1609459200" TAGS="python,programming">Python</A>
-    <DD>The Python programming language.
-    <DT><A HREF="https://rust-lang.org" ADD_DATE="1609459201" TAGS="rust,systems">Rust</A>
-    <DT><A HREF="https://example.com" ADD_DATE="1609459202">No Tags Example</A>
 </DL><p>
 """
 
-EMPTY_HTML = """\
-<!DOCTYPE NETSCAPE-Bookmark-file-1>
-<TITLE>Bookmarks</TITLE>
-<H1>Bookmarks</H1>
-<DL><p>
-</DL><p>
-"""
-
-NESTED_HTML = """\
+NESTED_HTML = b"""\
 <!DOCTYPE NETSCAPE-Bookmark-file-1>
 <TITLE>Bookmarks</TITLE>
 <H1>Bookmarks</H1>
@@ -43,38 +36,54 @@ NESTED_HTML = """\
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser():
     return BookmarkHTMLParser()
 
 
-@pytest.fixture
-def exporter():
-    return BookmarkHTMLExporter()
+@pytest.fixture(scope="module")
+def html_dir(tmp_path_factory):
+    """One directory shared by every file-based test in this module."""
+    return tmp_path_factory.mktemp("html", numbered=False)
+
+
+@pytest.fixture(scope="module")
+def netscape_html_path(html_dir, netscape_html):
+    """Write the shared Netscape document to disk once for the file-based tests."""
+    path = html_dir / "bookmarks.html"
+    path.write_bytes(netscape_html)
+    return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_bookmarks():
-    return [
+    """Module-wide export input; a tuple so no test can mutate the shared value."""
+    return (
         Bookmark(
             id=1,
             url="https://python.org",
             title="Python",
             description="The Python language",
-            tags=["python", "programming"],
-            created_at="2024-01-01T00:00:00",
-            updated_at="2024-01-01T00:00:00",
+            tags=("python", "programming"),
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 1),
         ),
         Bookmark(
             id=2,
             url="https://rust-lang.org",
             title="Rust",
             description="",
-            tags=["rust", "systems"],
-            created_at="2024-01-01T00:00:00",
-            updated_at="2024-01-01T00:00:00",
+            tags=("rust", "systems"),
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 1),
         ),
-    ]
+    )
+
+
+@pytest.fixture(scope="module")
+def exported_sample_html(sample_bookmarks):
+    """Render sample_bookmarks once; rendering is pure so tests can share it."""
+    return render_bookmarks_html(list(sample_bookmarks))
 
 
 # ---------------------------------------------------------------------------
@@ -82,59 +91,59 @@ def sample_bookmarks():
 # ---------------------------------------------------------------------------
 
 class TestBookmarkHTMLParser:
-    def test_parse_returns_list(self, parser):
-        results = parser.parse(NETSCAPE_HTML)
-        assert isinstance(results, list)
-
-    def test_parse_correct_count(self, parser):
-        results = parser.parse(NETSCAPE_HTML)
-        assert len(results) == 3
-
-    def test_parse_extracts_url(self, parser):
-        results = parser.parse(NETSCAPE_HTML)
-        urls = [r.url for r in results]
-        assert "https://python.org" in urls
-
-    def test_parse_extracts_title(self, parser):
-        results = parser.parse(NETSCAPE_HTML)
-        python_bm = next(r for r in results if r.url == "https://python.org")
-        assert python_bm.title == "Python"
-
-    def test_parse_extracts_tags(self, parser):
-        results = parser.parse(NETSCAPE_HTML)
-        python_bm = next(r for r in results if r.url == "https://python.org")
-        assert "python" in python_bm.tags
-        assert "programming" in python_bm.tags
-
-    def test_parse_handles_no_tags(self, parser):
-        results = parser.parse(NETSCAPE_HTML)
-        no_tag_bm = next(r for r in results if r.url == "https://example.com")
-        assert no_tag_bm.tags == [] or no_tag_bm.tags is not None
-
-    def test_parse_extracts_description(self, parser):
-        results = parser.parse(NETSCAPE_HTML)
-        python_bm = next(r for r in results if r.url == "https://python.org")
-        assert "Python" in (python_bm.description or "")
-
-    def test_parse_empty_file(self, parser):
-        results = parser.parse(EMPTY_HTML)
-        assert results == []
-
-    def test_parse_nested_folders(self, parser):
-        results = parser.parse(NESTED_HTML)
-        urls = [r.url for r in results]
-        assert "https://nested.com" in urls
-        assert "https://toplevel.com" in urls
-
-    def test_parse_from_file(self, parser, tmp_path):
-        html_file = tmp_path / "bookmarks.html"
-        html_file.write_text(NETSCAPE_HTML)
-        results = parser.parse_file(str(html_file))
+    def test_parse_returns_list(self, netscape_parsed):
+        assert isinstance(netscape_parsed, list)
+
+    def test_parse_correct_count(self, netscape_parsed):
+        assert len(netscape_parsed) == 3
+
+    def test_parse_extracts_url(self, netscape_by_url):
+        assert "https://python.org" in netscape_by_url
+
+    @pytest.mark.parametrize(
+        "url,attr,expected",
+        [
+            ("https://python.org", "title", "Python"),
+            ("https://python.org", "tags", ["python", "programming"]),
+            ("https://rust-lang.org", "title", "Rust"),
+            ("https://rust-lang.org", "tags", ["rust", "systems"]),
+            ("https://example.com", "title", "No Tags Example"),
+            ("https://example.com", "tags", []),
+        ],
+    )
+    def test_parse_attribute(self, netscape_by_url, url, attr, expected):
+        assert getattr(netscape_by_url[url], attr) == expected
+
+    def test_parse_extracts_description(self, netscape_by_url):
+        python_bm = netscape_by_url["https://python.org"]
+        assert python_bm.description == "The Python programming language."
+
+    def test_parse_description_keeps_inline_markup_text(self, parser, netscape_html):
+        html = netscape_html.replace(
+            b"<DD>The Python programming language.",
+            b"<DD>The <B>Python</B> programming language.",
+        )
+        python_bm = next(r for r in parser.parse(html) if r.url == "https://python.org")
+        assert python_bm.description == "The Python programming language."
+
+    @pytest.mark.parametrize(
+        "html,expected_urls",
+        [
+            (EMPTY_HTML, []),
+            (NESTED_HTML, ["https://nested.com", "https://toplevel.com"]),
+        ],
+        ids=["empty", "nested"],
+    )
+    def test_parse_document_urls(self, parser, html, expected_urls):
+        assert [r.url for r in parser.parse(html)] == expected_urls
+
+    def test_parse_from_file(self, parser, netscape_html_path):
+        results = parser.parse_file(str(netscape_html_path))
         assert len(results) == 3
 
     def test_parse_file_not_found(self, parser):
-        from bookmark_manager.exceptions import ImportError as BMImportError
-        with pytest.raises((FileNotFoundError, BMImportError, Exception)):
+        from bookmark_manager.exceptions import BookmarkImportError
+        with pytest.raises(BookmarkImportError, match="File not found"):
             parser.parse_file("/nonexistent/path/bookmarks.html")
 
 
@@ -143,36 +152,57 @@ class TestBookmarkHTMLParser:
 # ---------------------------------------------------------------------------
 
 class TestBookmarkHTMLExporter:
-    def test_export_returns_string(self, exporter, sample_bookmarks):
-        html = exporter.export(sample_bookmarks)
+    def test_export_returns_string(self, exported_sample_html):
+        html = exported_sample_html
         assert isinstance(html, str)
 
-    def test_export_contains_doctype(self, exporter, sample_bookmarks):
-        html = exporter.export(sample_bookmarks)
+    def test_export_contains_doctype(self, exported_sample_html):
+        html = exported_sample_html
         assert "NETSCAPE-Bookmark-file-1" in html
 
-    def test_export_contains_urls(self, exporter, sample_bookmarks):
-        html = exporter.export(sample_bookmarks)
-        assert "https://python.org" in html
-        assert "https://rust-lang.org" in html
-
-    def test_export_contains_titles(self, exporter, sample_bookmarks):
-        html = exporter.export(sample_bookmarks)
-        assert "Python" in html
-        assert "Rust" in html
-
-    def test_export_contains_tags(self, exporter, sample_bookmarks):
-        html = exporter.export(sample_bookmarks)
-        assert "python" in html.lower()
-
-    def test_export_empty_list(self, exporter):
-        html = exporter.export([])
+    def test_export_contains_all_fields(self, exported_sample_html):
+        expected = [
+            "https://python.org",
+            "https://rust-lang.org",
+            "Python",
+            "Rust",
+            'TAGS="programming,python"',
+            'TAGS="rust,systems"',
+        ]
+        missing = [fragment for fragment in expected if fragment not in exported_sample_html]
+        assert missing == []
+
+    def test_export_empty_list(self):
+        html = render_bookmarks_html([])
         assert isinstance(html, str)
         assert len(html) > 0
 
-    def test_export_to_file(self, exporter, sample_bookmarks, tmp_path):
-        out_file = tmp_path / "export.html"
-        exporter.export_to_file(sample_bookmarks, str(out_file))
+    def test_export_to_file(self, sample_bookmarks, html_dir):
+        out_file = html_dir / "export_to_file.html"
+        export_bookmarks_to_html(list(sample_bookmarks), str(out_file))
         assert out_file.exists()
-        content = out_file.read_text()
-        assert "https://python.org" in content
+        assert b"https://python.org" in out_file.read_bytes()
+
+
+# ---------------------------------------------------------------------------
+# Round-trip tests
+# ---------------------------------------------------------------------------
+
+class TestHTMLParserRoundTrip:
+    """Export then re-parse in memory; test_export_to_file covers the disk path."""
+
+    def test_roundtrip_preserves_urls(self, parser, exported_sample_html, sample_bookmarks):
+        reimported = parser.parse(exported_sample_html)
+        assert [r.url for r in reimported] == [bm.url for bm in sample_bookmarks]
+
+    def test_roundtrip_preserves_titles(self, parser, exported_sample_html, sample_bookmarks):
+        reimported = parser.parse(exported_sample_html)
+        assert [r.title for r in reimported] == [bm.title for bm in sample_bookmarks]
+
+    def test_roundtrip_preserves_descriptions(
+        self, parser, exported_sample_html, sample_bookmarks
+    ):
+        reimported = parser.parse(exported_sample_html)
+        assert [r.description for r in reimported] == [
+            bm.description for bm in sample_bookmarks
+        ]
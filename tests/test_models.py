@@ -8,50 +8,48 @@ import pytest
 from bookmark_manager.models import Bookmark, ImportResult, Tag, TagCount
 
 
+# Fixed timestamp: none of these tests compare against the wall clock.
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+BOOKMARK_CASES = [
+    dict(id=None, url="https://example.com", title="Example",
+         description=None, tags=(), created_at=None, updated_at=None),
+    dict(id=1, url="https://example.com", title="Example",
+         description="A description", tags=("python", "web"),
+         created_at=_NOW, updated_at=_NOW),
+]
+
+
 class TestBookmark:
-    def test_bookmark_creation_minimal(self):
-        bm = Bookmark(id=None, url="https://example.com", title="Example",
-                      description=None, tags=[], created_at=None, updated_at=None)
-        assert bm.url == "https://example.com"
-        assert bm.title == "Example"
-        assert bm.tags == []
-        assert bm.id is None
-
-    def test_bookmark_creation_full(self):
-        now = datetime.utcnow()
-        bm = Bookmark(
-            id=1,
-            url="https://example.com",
-            title="Example",
-            description="A description",
-            tags=["python", "web"],
-            created_at=now,
-            updated_at=now,
-        )
-        assert bm.id == 1
-        assert bm.description == "A description"
-        assert "python" in bm.tags
-        assert bm.created_at == now
+    @pytest.mark.parametrize("kwargs", BOOKMARK_CASES, ids=["minimal", "full"])
+    def test_bookmark_creation(self, kwargs):
+        bm = Bookmark(**kwargs)
+        for name, value in kwargs.items():
+            assert getattr(bm, name) == value
 
-    def test_bookmark_tags_are_list(self):
+    def test_bookmark_tags_are_sorted_tuple(self):
         bm = Bookmark(id=None, url="https://example.com", title="T",
-                      description=None, tags=["a", "b", "c"],
+                      description=None, tags=("c", "a", "b", "a"),
                       created_at=None, updated_at=None)
-        assert isinstance(bm.tags, list)
-        assert len(bm.tags) == 3
+        assert bm.tags == ("a", "b", "c")
+
+    def test_bookmark_is_hashable(self):
+        bm = Bookmark(id=1, url="https://a.com", title="A",
+                      description=None, tags=("x",), created_at=None, updated_at=None)
+        assert {bm, bm} == {bm}
 
     def test_bookmark_equality(self):
         bm1 = Bookmark(id=1, url="https://a.com", title="A",
-                       description=None, tags=[], created_at=None, updated_at=None)
+                       description=None, tags=(), created_at=None, updated_at=None)
         bm2 = Bookmark(id=1, url="https://a.com", title="A",
-                       description=None, tags=[], created_at=None, updated_at=None)
+                       description=None, tags=(), created_at=None, updated_at=None)
         assert bm1 == bm2
 
     def test_bookmark_inequality(self):
         bm1 = Bookmark(id=1, url="https://a.com", title="A",
-                       description=None, tags=[], created_at=None, updated_at=None)
+                       description=None, tags=(), created_at=None, updated_at=None)
         bm2 = Bookmark(id=2, url="https://b.com", title="B",
-                       description=None, tags=[], created_at=None, updated_at=None)
+                       description=None, tags=(), created_at=None, updated_at=None)
         assert bm1 != bm2
 
 
@@ -62,7 +60,9 @@ class TestTag:
         assert tag.name == "python"
 
     def test_tag_equality(self):
-        assert Tag(id=1, name="python") == Tag(id=1, name="python")
+        assert Tag(id=1, name="python", created_at=_NOW) == Tag(
+            id=1, name="python", created_at=_NOW
+        )
 
     def test_tag_inequality(self):
         assert Tag(id=1, name="python") != Tag(id=2, name="java")
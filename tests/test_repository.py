@@ -1,8 +1,15 @@
 """Unit + integration tests for bookmark_manager/repository.py."""
+from dataclasses import replace
+
 import pytest
 from bookmark_manager.database import Database
-from bookmark_manager.repository import BookmarkRepository
+from bookmark_manager.exceptions import (
+    BookmarkNotFoundError,
+    DatabaseError,
+    DuplicateBookmarkError,
+)
 from bookmark_manager.models import Bookmark
+from bookmark_manager.repository import BookmarkRepository
 
 
 # ---------------------------------------------------------------------------
@@ -10,21 +17,33 @@ from bookmark_manager.models import Bookmark
 # ---------------------------------------------------------------------------
 
 @pytest.fixture
-def db(tmp_path):
-    db_file = tmp_path / "test.db"
-    database = Database(str(db_file))
-    database.initialize()
-    return database
+def repo(repository):
+    return repository
 
 
-@pytest.fixture
-def repo(db):
-    return BookmarkRepository(db)
+def _create(repo, url, title="", description="", tags=()):
+    """Create a bookmark through the repository API and attach ``tags``."""
+    bm = repo.create_bookmark(url=url, title=title, description=description)
+    if tags:
+        repo.add_tags_to_bookmark(bm.id, list(tags))
+        bm = repo.get_bookmark_by_id(bm.id)
+    return bm
+
+
+def assert_matches(database, sql, params, expected):
+    """Assert that a ``SELECT COUNT(*)`` query returns *expected*.
+
+    Lets a test check how many rows satisfy a condition without building
+    Bookmark objects for them.
+    """
+    with database.connection() as conn:
+        assert conn.execute(sql, params).fetchone()[0] == expected
 
 
 @pytest.fixture
 def created_bookmark(repo):
-    return repo.create(
+    return _create(
+        repo,
         url="https://example.com",
         title="Example",
         description="A test site",
@@ -36,21 +55,89 @@ def created_bookmark(repo):
 # Create
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def created_once(class_repository):
+    return _create(
+        class_repository,
+        url="https://example.com",
+        title="Example",
+        description="A test site",
+        tags=["python", "test"],
+    )
+
+
 class TestCreate:
-    def test_create_returns_bookmark(self, repo):
-        bm = repo.create(url="https://example.com", title="Example", tags=["web"])
-        assert bm.id is not None
-        assert bm.url == "https://example.com"
-        assert "web" in bm.tags
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("url", "https://example.com"),
+            ("title", "Example"),
+            ("description", "A test site"),
+            ("tags", ("python", "test")),
+        ],
+    )
+    def test_create_stores_field(self, created_once, attr, expected):
+        assert getattr(created_once, attr) == expected
 
-    def test_create_without_tags(self, repo):
-        bm = repo.create(url="https://notags.com", title="No Tags")
-        assert bm.tags == [] or bm.tags is not None
+    def test_create_assigns_id(self, created_once):
+        assert isinstance(created_once.id, int)
+        assert created_once.id > 0
 
-    def test_create_assigns_id(self, repo):
-        bm = repo.create(url="https://unique.com", title="Unique")
-        assert isinstance(bm.id, int)
-        assert bm.id > 0
+    def test_create_without_tags(self, repo):
+        bm = repo.create_bookmark(url="https://notags.com", title="No Tags")
+        assert bm.tags == ()
+
+    def test_create_returns_persisted_state(self, repo):
+        bm = repo.create_bookmark(url="https://persisted.com", title="Persisted")
+        fetched = repo.get_bookmark_by_id(bm.id)
+        assert bm == fetched
+        assert (bm.created_at, bm.updated_at) == (fetched.created_at, fetched.updated_at)
+        assert bm.created_at is not None
+
+
+@pytest.fixture(scope="class")
+def seeded_url(class_repository):
+    url = "https://seed.example.com"
+    class_repository.create_bookmark(url=url, title="Seed")
+    return url
+
+
+class TestDuplicates:
+    def test_create_duplicate_url_raises(self, class_repository, seeded_url):
+        with pytest.raises(DuplicateBookmarkError):
+            class_repository.create_bookmark(url=seeded_url, title="Again")
+
+    def test_bulk_create_duplicate_rolls_back_batch(
+        self, class_repository, seeded_url, sample_bookmarks
+    ):
+        fresh = sample_bookmarks[0]
+        seed = Bookmark(id=None, url=seeded_url, title="Again", description="",
+                        tags=(), created_at=None, updated_at=None)
+        with pytest.raises(DuplicateBookmarkError):
+            class_repository.bulk_create([fresh, seed])
+        assert class_repository.get_bookmark_by_url(fresh.url) is None
+
+
+class TestBulkCreate:
+    def test_bulk_create_returns_bookmarks_in_order(self, repo, sample_bookmarks):
+        created = repo.bulk_create(sample_bookmarks)
+        assert [bm.url for bm in created] == [bm.url for bm in sample_bookmarks]
+        assert all(isinstance(bm.id, int) for bm in created)
+
+    def test_bulk_create_persists_tags(self, repo, sample_bookmarks):
+        created = repo.bulk_create(sample_bookmarks)
+        fetched = repo.get_bookmark_by_id(created[0].id)
+        assert fetched.tags == sample_bookmarks[0].tags
+
+    def test_bulk_create_stores_missing_title_as_empty(self, repo, sample_bookmarks):
+        untitled = replace(sample_bookmarks[0], title=None)
+        (created,) = repo.bulk_create([untitled])
+        assert repo.get_bookmark_by_id(created.id).title == ""
+
+    def test_bulk_create_reports_other_integrity_errors(self, repo, sample_bookmarks):
+        # A NOT NULL violation is not a duplicate URL and must not be reported as one.
+        with pytest.raises(DatabaseError):
+            repo.bulk_create([replace(sample_bookmarks[0], url=None)])
 
 
 # ---------------------------------------------------------------------------
@@ -59,21 +146,21 @@ class TestCreate:
 
 class TestRead:
     def test_get_by_id(self, repo, created_bookmark):
-        fetched = repo.get_by_id(created_bookmark.id)
-        assert fetched is not None
+        fetched = repo.get_bookmark_by_id(created_bookmark.id)
         assert fetched.id == created_bookmark.id
+        assert fetched.tags == ("python", "test")
 
     def test_get_by_id_not_found(self, repo):
-        result = repo.get_by_id(99999)
-        assert result is None
+        with pytest.raises(BookmarkNotFoundError):
+            repo.get_bookmark_by_id(99999)
 
     def test_get_by_url(self, repo, created_bookmark):
-        fetched = repo.get_by_url("https://example.com")
+        fetched = repo.get_bookmark_by_url("https://example.com")
         assert fetched is not None
         assert fetched.url == "https://example.com"
 
     def test_get_by_url_not_found(self, repo):
-        result = repo.get_by_url("https://doesnotexist.io")
+        result = repo.get_bookmark_by_url("https://doesnotexist.io")
         assert result is None
 
 
@@ -82,44 +169,89 @@ class TestRead:
 # ---------------------------------------------------------------------------
 
 class TestList:
-    def test_list_all_returns_all(self, repo):
-        repo.create(url="https://a.com", title="A")
-        repo.create(url="https://b.com", title="B")
-        results = repo.list_all()
-        assert len(results) >= 2
-
-    def test_list_respects_limit(self, repo):
-        for i in range(5):
-            repo.create(url=f"https://site{i}.com", title=f"Site {i}")
-        results = repo.list_all(limit=3)
-        assert len(results) <= 3
+    def test_list_all_returns_all(self, populated_repository, sample_bookmarks):
+        results = populated_repository.list_bookmarks()
+        assert len(results) == len(sample_bookmarks)
+
+    def test_list_respects_limit(self, populated_repository):
+        results = populated_repository.list_bookmarks(limit=2)
+        assert len(results) == 2
 
     def test_list_empty_db(self, repo):
-        results = repo.list_all()
-        assert isinstance(results, list)
+        results = repo.list_bookmarks()
+        assert results == []
 
 
 # ---------------------------------------------------------------------------
-# Find by tag
+# Full-text search
 # ---------------------------------------------------------------------------
 
-class TestFindByTag:
-    def test_find_by_tag_returns_matching(self, repo):
-        repo.create(url="https://python.org", title="Python", tags=["python"])
-        repo.create(url="https://rust-lang.org", title="Rust", tags=["rust"])
-        results = repo.find_by_tag("python")
-        assert any(bm.url == "https://python.org" for bm in results)
-        assert all("python" in bm.tags for bm in results)
+class TestSearch:
+    def test_search_by_url(self, populated_repository):
+        results = populated_repository.search_fts("python.org")
+        assert [bm.url for bm in results] == ["https://python.org"]
+
+    def test_search_by_description(self, populated_repository):
+        results = populated_repository.search_fts("Testing framework")
+        assert [bm.url for bm in results] == ["https://pytest.org"]
+
+    def test_search_matches_stemmed_terms(self, populated_repository):
+        results = populated_repository.search_fts("languages")
+        assert [bm.url for bm in results] == ["https://python.org"]
+
+    def test_search_matches_prefixes(self, populated_repository):
+        results = populated_repository.search_fts("pyth")
+        assert [bm.url for bm in results] == ["https://python.org"]
+
+    def test_search_no_match(self, populated_repository):
+        assert populated_repository.search_fts("nonexistent-xyz") == []
+
+    def test_search_bookmarks_keeps_substring_matching(self, populated_repository):
+        # "ython.o" is not a word prefix, so only the LIKE search finds it.
+        results = populated_repository.search_bookmarks("ython.o")
+        assert [bm.url for bm in results] == ["https://python.org"]
+        assert populated_repository.search_fts("ython.o") == []
+
+    def test_initialize_tolerates_sqlite_without_fts5(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "bookmark_manager.database.FTS_SCHEMA",
+            "CREATE VIRTUAL TABLE bookmarks_fts USING no_such_fts_module(url);",
+        )
+        db = Database(tmp_path / "nofts.db")
+        db.initialize()
+        repo = BookmarkRepository(db)
+        repo.create_bookmark(url="https://python.org", title="Python")
+        assert [bm.url for bm in repo.search_bookmarks("ython.o")] == ["https://python.org"]
+
+    def test_search_sees_updates(self, repo, created_bookmark):
+        repo.update_bookmark(created_bookmark.id, title="Renamed Entry")
+        results = repo.search_fts("renamed")
+        assert [bm.id for bm in results] == [created_bookmark.id]
 
-    def test_find_by_tag_no_match(self, repo):
-        results = repo.find_by_tag("nonexistent-tag-xyz")
+
+# ---------------------------------------------------------------------------
+# List by tag
+# ---------------------------------------------------------------------------
+
+class TestListByTag:
+    def test_list_by_tag_returns_matching(self, populated_db, populated_repository):
+        results = populated_repository.list_bookmarks(tag="python")
+        assert {bm.url for bm in results} == {"https://python.org", "https://pytest.org"}
+        assert_matches(
+            populated_db,
+            "SELECT COUNT(*) FROM bookmark_tags bt"
+            " JOIN tags t ON t.id = bt.tag_id WHERE t.name = ?",
+            ("python",),
+            len(results),
+        )
+
+    def test_list_by_tag_no_match(self, populated_repository):
+        results = populated_repository.list_bookmarks(tag="nonexistent-tag-xyz")
         assert results == []
 
-    def test_find_by_tag_limit(self, repo):
-        for i in range(5):
-            repo.create(url=f"https://tagged{i}.com", title=f"Tagged {i}", tags=["shared"])
-        results = repo.find_by_tag("shared", limit=2)
-        assert len(results) <= 2
+    def test_list_by_tag_limit(self, populated_repository):
+        results = populated_repository.list_bookmarks(tag="python", limit=1)
+        assert len(results) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -128,32 +260,46 @@ class TestFindByTag:
 
 class TestDelete:
     def test_delete_removes_bookmark(self, repo, created_bookmark):
-        repo.delete(created_bookmark.id)
-        assert repo.get_by_id(created_bookmark.id) is None
+        assert repo.delete_bookmark(created_bookmark.id) == created_bookmark.id
+        with pytest.raises(BookmarkNotFoundError):
+            repo.get_bookmark_by_id(created_bookmark.id)
 
-    def test_delete_nonexistent_does_not_raise(self, repo):
-        # Should not raise an exception
-        repo.delete(99999)
+    def test_delete_nonexistent_raises(self, repo):
+        with pytest.raises(BookmarkNotFoundError):
+            repo.delete_bookmark(99999)
 
 
 # ---------------------------------------------------------------------------
 # Tags
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def tag_counts(populated_repository):
+    """Tag name -> usage count for the seeded corpus, fetched once per class."""
+    return {t.name: t.count for t in populated_repository.list_all_tags()}
+
+
 class TestTags:
-    def test_get_all_tags(self, repo):
-        repo.create(url="https://a.com", title="A", tags=["alpha", "beta"])
-        repo.create(url="https://b.com", title="B", tags=["beta", "gamma"])
-        tags = repo.get_all_tags()
-        tag_names = [t.name for t in tags]
-        assert "alpha" in tag_names
-        assert "beta" in tag_names
-        assert "gamma" in tag_names
-
-    def test_tag_count_is_accurate(self, repo):
-        repo.create(url="https://x.com", title="X", tags=["counted"])
-        repo.create(url="https://y.com", title="Y", tags=["counted"])
-        tags = repo.get_all_tags()
-        counted = next((t for t in tags if t.name == "counted"), None)
-        assert counted is not None
-        assert counted.count >= 2
+    def test_list_all_tags(self, populated_repository):
+        names = [t.name for t in populated_repository.list_all_tags()]
+        assert len(names) == len(set(names))
+        assert set(names) == {"python", "programming", "testing", "git", "hosting"}
+
+    @pytest.mark.parametrize(
+        "name, expected_count",
+        [
+            ("python", 2),
+            ("programming", 1),
+            ("testing", 1),
+            ("git", 1),
+            ("hosting", 1),
+        ],
+    )
+    def test_tag_count_is_accurate(self, tag_counts, name, expected_count):
+        assert tag_counts[name] == expected_count
+
+    def test_unused_tag_counts_zero(self, repo):
+        # Guards the LEFT JOIN count: COUNT(*) would report 1 here.
+        repo.get_or_create_tag("orphan")
+        counts = {t.name: t.count for t in repo.list_all_tags()}
+        assert counts["orphan"] == 0
@@ -1,8 +1,12 @@
 """Unit tests for bookmark_manager/service.py."""
+from datetime import datetime
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
+from bookmark_manager.config import DEFAULT_LIST_LIMIT
+from bookmark_manager.repository import BookmarkRepository
 from bookmark_manager.service import BookmarkService
-from bookmark_manager.models import Bookmark, ImportResult
+from bookmark_manager.models import Bookmark
 from bookmark_manager.exceptions import (
     InvalidURLError,
     DuplicateBookmarkError,
@@ -14,28 +18,44 @@ from bookmark_manager.exceptions import (
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_repo():
-    return MagicMock()
+    return Mock(spec=BookmarkRepository)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_repo(mock_repo):
+    """Clear calls, return values and side effects left by the previous test."""
+    mock_repo.reset_mock(return_value=True, side_effect=True)
+
+
+class _Recorder:
+    """Minimal callable stub: records each call and returns ``ret``."""
+
+    def __init__(self, ret=None):
+        self.ret = ret
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.ret
 
 
 @pytest.fixture
 def service(mock_repo):
-    svc = BookmarkService.__new__(BookmarkService)
-    svc.repo = mock_repo
-    return svc
+    return BookmarkService(mock_repo)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_bookmark():
     return Bookmark(
         id=1,
         url="https://example.com",
         title="Example",
         description="A test bookmark",
-        tags=["python", "test"],
-        created_at="2024-01-01T00:00:00",
-        updated_at="2024-01-01T00:00:00",
+        tags=("python", "test"),
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
     )
 
 
@@ -44,25 +64,26 @@ def sample_bookmark():
 # ---------------------------------------------------------------------------
 
 class TestURLValidation:
-    def test_valid_https_url(self, service):
-        result = service._normalize_url("https://example.com")
-        assert result == "https://example.com"
-
-    def test_valid_http_url(self, service):
-        result = service._normalize_url("http://example.com")
-        assert result == "http://example.com"
-
-    def test_adds_https_scheme(self, service):
-        result = service._normalize_url("example.com")
-        assert result.startswith("https://")
-
-    def test_rejects_empty_url(self, service):
-        with pytest.raises(InvalidURLError):
-            service._normalize_url("")
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("https://example.com", "https://example.com"),
+            ("http://example.com", "http://example.com"),
+            ("example.com", "https://example.com"),
+        ],
+        ids=["https", "http", "adds-scheme"],
+    )
+    def test_normalize_url(self, service, raw, expected):
+        assert service._normalize_url(raw) == expected
 
-    def test_rejects_non_http_scheme(self, service):
+    @pytest.mark.parametrize(
+        "raw",
+        ["", "ftp://example.com"],
+        ids=["empty", "non-http-scheme"],
+    )
+    def test_rejects_invalid_url(self, service, raw):
         with pytest.raises(InvalidURLError):
-            service._normalize_url("ftp://example.com")
+            service._normalize_url(raw)
 
 
 # ---------------------------------------------------------------------------
@@ -70,27 +91,23 @@ class TestURLValidation:
 # ---------------------------------------------------------------------------
 
 class TestTagNormalization:
-    def test_lowercases_tags(self, service):
-        result = service._normalize_tags(["Python", "DJANGO"])
-        assert result == ["python", "django"]
-
-    def test_strips_whitespace(self, service):
-        result = service._normalize_tags(["  python  ", " django"])
-        assert "python" in result
-        assert "django" in result
-
-    def test_deduplicates_tags(self, service):
-        result = service._normalize_tags(["python", "python", "django"])
-        assert result.count("python") == 1
-
-    def test_removes_empty_tags(self, service):
-        result = service._normalize_tags(["", "  ", "python"])
-        assert "" not in result
-        assert "python" in result
-
-    def test_returns_sorted_list(self, service):
-        result = service._normalize_tags(["zebra", "apple", "mango"])
-        assert result == sorted(result)
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            (["Python", "DJANGO"], ["django", "python"]),
+            (["  python  ", " django"], ["django", "python"]),
+            (["python", "python", "django"], ["django", "python"]),
+            (["", "  ", "python"], ["python"]),
+            (["zebra", "apple", "mango"], ["apple", "mango", "zebra"]),
+        ],
+        ids=["lowercases", "strips", "deduplicates", "drops-empty", "sorts"],
+    )
+    def test_normalize_tags(self, service, raw, expected):
+        result = service._normalize_tags(raw)
+        assert result == expected
+        # Invariants of any output: sorted, unique, non-empty and normalised.
+        assert result == sorted(set(result))
+        assert all(t and t == t.strip().lower() for t in result)
 
 
 # ---------------------------------------------------------------------------
@@ -99,20 +116,24 @@ class TestTagNormalization:
 
 class TestAddBookmark:
     def test_add_valid_bookmark(self, service, mock_repo, sample_bookmark):
-        mock_repo.get_by_url.return_value = None
-        mock_repo.create.return_value = sample_bookmark
+        mock_repo.create_bookmark.return_value = sample_bookmark
+        mock_repo.get_bookmark_by_id.return_value = sample_bookmark
         result = service.add_bookmark("https://example.com", tags=["python"])
         assert result.url == "https://example.com"
-        mock_repo.create.assert_called_once()
+        mock_repo.create_bookmark.assert_called_once()
+        mock_repo.add_tags_to_bookmark.assert_called_once_with(1, ["python"])
 
-    def test_raises_on_duplicate(self, service, mock_repo, sample_bookmark):
-        mock_repo.get_by_url.return_value = sample_bookmark
+    def test_raises_on_duplicate(self, service, mock_repo):
+        mock_repo.create_bookmark.side_effect = DuplicateBookmarkError(
+            "https://example.com"
+        )
         with pytest.raises(DuplicateBookmarkError):
             service.add_bookmark("https://example.com")
 
     def test_raises_on_invalid_url(self, service, mock_repo):
         with pytest.raises(InvalidURLError):
-            service.add_bookmark("not-a-url-at-all-!!")
+            service.add_bookmark("https://")
+        mock_repo.create_bookmark.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -120,13 +141,12 @@ class TestAddBookmark:
 # ---------------------------------------------------------------------------
 
 class TestDeleteBookmark:
-    def test_delete_existing(self, service, mock_repo, sample_bookmark):
-        mock_repo.get_by_id.return_value = sample_bookmark
+    def test_delete_existing(self, service, mock_repo):
         service.delete_bookmark(1)
-        mock_repo.delete.assert_called_once_with(1)
+        mock_repo.delete_bookmark.assert_called_once_with(1)
 
     def test_raises_when_not_found(self, service, mock_repo):
-        mock_repo.get_by_id.return_value = None
+        mock_repo.delete_bookmark.side_effect = BookmarkNotFoundError(999)
         with pytest.raises(BookmarkNotFoundError):
             service.delete_bookmark(999)
 
@@ -137,17 +157,29 @@ class TestDeleteBookmark:
 
 class TestSearchAndList:
     def test_list_all(self, service, mock_repo, sample_bookmark):
-        mock_repo.list_all.return_value = [sample_bookmark]
+        mock_repo.list_bookmarks.return_value = [sample_bookmark]
         results = service.list_bookmarks()
         assert len(results) == 1
 
-    def test_search_by_tag(self, service, mock_repo, sample_bookmark):
-        mock_repo.find_by_tag.return_value = [sample_bookmark]
-        results = service.search_by_tag("python")
+    def test_list_by_tag(self, service, mock_repo, sample_bookmark, monkeypatch):
+        list_bookmarks = _Recorder(ret=[sample_bookmark])
+        monkeypatch.setattr(mock_repo, "list_bookmarks", list_bookmarks)
+        results = service.list_bookmarks(tag=" Python ")
         assert results[0].url == "https://example.com"
-        mock_repo.find_by_tag.assert_called_once_with("python", limit=None)
+        assert list_bookmarks.calls == [
+            ((), {"tag": "python", "limit": DEFAULT_LIST_LIMIT, "offset": 0})
+        ]
 
-    def test_search_returns_empty_list(self, service, mock_repo):
-        mock_repo.find_by_tag.return_value = []
-        results = service.search_by_tag("nonexistent")
+    def test_list_by_tag_returns_empty_list(self, service, mock_repo, monkeypatch):
+        monkeypatch.setattr(mock_repo, "list_bookmarks", _Recorder(ret=[]))
+        results = service.list_bookmarks(tag="nonexistent")
         assert results == []
+
+    def test_search_fts_strips_query(self, service, mock_repo, sample_bookmark):
+        mock_repo.search_fts.return_value = [sample_bookmark]
+        assert service.search_bookmarks_fts("  pyth ") == [sample_bookmark]
+        mock_repo.search_fts.assert_called_once_with("pyth", limit=DEFAULT_LIST_LIMIT)
+
+    def test_search_fts_blank_query_returns_empty(self, service, mock_repo):
+        assert service.search_bookmarks_fts("   ") == []
+        mock_repo.search_fts.assert_not_called()